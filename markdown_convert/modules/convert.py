@@ -47,7 +47,7 @@ def convert(md_path, css_path=None, output_path=None,
         (weasyprint
          .HTML(string=html, base_url='.')
          .write_pdf(target=output_path,
-                    stylesheets=list(css_sources)))
+                    stylesheets=css_sources))
 
     except Exception as exc:
         raise RuntimeError(exc) from exc
@@ -4,6 +4,7 @@ path, and the usage message.
 Author: @julynx
 """
 
+from functools import lru_cache
 from pathlib import Path
 
 import pkg_resources
@@ -33,9 +34,10 @@ def get_output_path(md_path, output_dir=None):
     if output_dir.suffix == ".pdf":
         return output_dir
 
-    return output_dir.parent / f"{Path(md_path).stem}.pdf"
+    return output_dir.parent / f"{md_path.stem}.pdf"
 
 
+@lru_cache(maxsize=None)
 def get_css_path():
     """
     Get the path to the default CSS file.
@@ -47,6 +49,7 @@ def get_css_path():
                                            'default.css')
 
 
+@lru_cache(maxsize=None)
 def get_code_css_path():
     """
     Get the path to the code CSS file.
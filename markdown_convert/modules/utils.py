@@ -5,6 +5,8 @@ Author: @julynx
 
 import platform
 
+_IS_WINDOWS = platform.system() == "Windows"
+
 
 def color(color_code, text):
     """
@@ -19,7 +21,7 @@ def color(color_code, text):
     """
 
     # Disable if running on Windows
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         return text
 
     return f"\033[{color_code}m{text}\033[0m"
@@ -3,7 +3,7 @@ This module contains functions to validate the input paths.
 Author: @julynx
 """
 
-from pathlib import Path
+import os
 
 
 def validate_markdown_path(md_path):
@@ -17,7 +17,7 @@ def validate_markdown_path(md_path):
         FileNotFoundError: If the file is not found.
         ValueError: If the file is not a Markdown file.
     """
-    if not Path(md_path).is_file():
+    if not os.path.isfile(md_path):
         raise FileNotFoundError(f"File not found: '{md_path}'")
 
     if not md_path.endswith(".md"):
@@ -35,7 +35,7 @@ def validate_css_path(css_path):
         FileNotFoundError: If the file is not found.
         ValueError: If the file is not a CSS file.
     """
-    if not Path(css_path).is_file():
+    if not os.path.isfile(css_path):
         raise FileNotFoundError(f"File not found: '{css_path}'")
 
     if not css_path.endswith(".css"):
@@ -52,10 +52,10 @@ def validate_output_path(output_dir):
     Raises:
         FileNotFoundError: If the directory is not found.
     """
-    check_dir = Path(output_dir)
+    check_dir = output_dir or "."
 
     if output_dir.endswith(".pdf"):
-        check_dir = check_dir.parent
+        check_dir = os.path.dirname(output_dir) or "."
 
-    if not check_dir.is_dir():
+    if not os.path.isdir(check_dir):
         raise FileNotFoundError(f"Directory not found: '{check_dir}'")